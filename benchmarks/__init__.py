@@ -0,0 +1,3 @@
+# benchmarks/__init__.py
+# Offline evaluation and benchmark scripts for the recommendation engines.
+# Run them from the repository root, e.g. `python -m benchmarks.evaluate --synthetic`.
@@ -0,0 +1,239 @@
+# benchmarks/evaluate.py
+# Offline evaluation harness for the recommendation sources used by /recommendations.
+#
+# Splits 'user_interactions' by time (older views are training data, newer views are the holdout),
+# builds every source on the training data, runs it in batch over all users and reports
+# precision@k, recall@k, catalogue coverage and users/second, plus a combined quality-vs-throughput report.
+#
+# Usage (from the repository root):
+#   python -m benchmarks.evaluate                      # evaluate against the configured MySQL database
+#   python -m benchmarks.evaluate --synthetic          # evaluate against generated data
+#   python -m benchmarks.evaluate --synthetic --output new.json --baseline old.json
+import argparse
+import json
+import time
+
+import pandas as pd
+
+import recommender
+from benchmarks.synthetic import generate_dataset
+
+# --- DATA SPLITTING ---
+
+def time_based_split(interactions_df, test_fraction=0.2):
+    """
+    Splits interactions at a single point in time: the newest `test_fraction` of views form the holdout.
+    Returns (train_df, test_df, cutoff).
+    """
+    if interactions_df.empty or 'interaction_time' not in interactions_df.columns:
+        raise ValueError("Interactions must include 'interaction_time' for a time-based split.")
+
+    times = pd.to_datetime(interactions_df['interaction_time'])
+    cutoff = times.quantile(1 - test_fraction)
+    train_df = interactions_df[times < cutoff].reset_index(drop=True)
+    test_df = interactions_df[times >= cutoff].reset_index(drop=True)
+    return train_df, test_df, cutoff
+
+def build_ground_truth(train_df, test_df, include_cold_users=False):
+    """
+    Maps each evaluated user to the set of products they viewed in the holdout but not in training.
+    Users without training history are skipped unless include_cold_users is set.
+    """
+    seen = train_df.groupby('user_id')['product_id'].agg(set).to_dict()
+    ground_truth = {}
+    for user_id, products in test_df.groupby('user_id')['product_id'].agg(set).items():
+        if user_id not in seen and not include_cold_users:
+            continue
+        relevant = products - seen.get(user_id, set())
+        if relevant:
+            ground_truth[user_id] = relevant
+    return ground_truth
+
+# --- RECOMMENDATION SOURCES ---
+# Each source has a build step (run once on the training data) and a per-user recommend step,
+# mirroring how the /recommendations endpoint uses the functions in recommender.py.
+
+def _build_itemcf(train_df, products_df):
+    return recommender.build_item_cf_model(train_df)
+
+def _recommend_itemcf(state, user_id, train_df, products_df, k):
+    return recommender.get_item_cf_recommendations(user_id, state, top_n=k)
+
+def _build_ubcf(train_df, products_df):
+    user_item_matrix, _ = recommender.create_user_item_matrix(train_df)
+    return {'user_item_matrix': user_item_matrix}
+
+def _recommend_ubcf(state, user_id, train_df, products_df, k):
+    return recommender.get_ubcf_recommendations(user_id, state['user_item_matrix'], top_n=k)
+
+def _build_content(train_df, products_df):
+    similarity_matrix, product_ids = recommender.calculate_content_based_similarity(products_df)
+    return {'similarity_matrix': similarity_matrix, 'product_ids': product_ids}
+
+def _recommend_content(state, user_id, train_df, products_df, k):
+    if state['similarity_matrix'].size == 0:
+        return []
+    return recommender.get_content_based_recommendations(
+        user_id, products_df, train_df, state['similarity_matrix'], state['product_ids'], top_n=k
+    )
+
+def _build_popular(train_df, products_df):
+    return {}
+
+def _recommend_popular(state, user_id, train_df, products_df, k):
+    return recommender.get_popular_recommendations(train_df, top_n=k)
+
+SOURCES = {
+    'itemcf': (_build_itemcf, _recommend_itemcf),
+    'ubcf': (_build_ubcf, _recommend_ubcf),
+    'content': (_build_content, _recommend_content),
+    'popular': (_build_popular, _recommend_popular),
+}
+
+# --- METRICS ---
+
+def evaluate_source(name, train_df, products_df, ground_truth, k=5):
+    """Builds one source, runs it over every evaluated user and returns its metrics as a dict."""
+    build, recommend = SOURCES[name]
+
+    build_start = time.perf_counter()
+    state = build(train_df, products_df)
+    build_seconds = time.perf_counter() - build_start
+
+    recommendations = {}
+    serve_start = time.perf_counter()
+    for user_id in ground_truth:
+        try:
+            recommendations[user_id] = list(recommend(state, user_id, train_df, products_df, k))[:k]
+        except Exception as e:
+            print(f"Error recommending with {name} for user {user_id}: {e}")
+            recommendations[user_id] = []
+    serve_seconds = time.perf_counter() - serve_start
+
+    precisions, recalls = [], []
+    recommended_items = set()
+    users_served = 0
+    for user_id, relevant in ground_truth.items():
+        recs = recommendations[user_id]
+        hits = len(set(recs) & relevant)
+        precisions.append(hits / k)
+        recalls.append(hits / len(relevant))
+        recommended_items.update(recs)
+        if recs:
+            users_served += 1
+
+    n_users = len(ground_truth)
+    n_products = len(products_df)
+    return {
+        'source': name,
+        'k': k,
+        'users': n_users,
+        f'precision@{k}': sum(precisions) / n_users if n_users else 0.0,
+        f'recall@{k}': sum(recalls) / n_users if n_users else 0.0,
+        'coverage': len(recommended_items) / n_products if n_products else 0.0,
+        'user_coverage': users_served / n_users if n_users else 0.0,
+        'build_seconds': build_seconds,
+        'serve_seconds': serve_seconds,
+        'users_per_second': n_users / serve_seconds if serve_seconds > 0 else float('inf'),
+    }
+
+def pareto_front(results, k):
+    """Names of the sources not beaten on both precision@k and users/second by another source."""
+    key = f'precision@{k}'
+    front = set()
+    for r in results:
+        dominated = any(
+            o[key] >= r[key] and o['users_per_second'] >= r['users_per_second']
+            and (o[key] > r[key] or o['users_per_second'] > r['users_per_second'])
+            for o in results if o is not r
+        )
+        if not dominated:
+            front.add(r['source'])
+    return front
+
+# --- REPORTING ---
+
+def format_report(results, k, baseline=None):
+    """Returns the combined quality-vs-throughput table as text, with deltas against a baseline report if given."""
+    baseline_by_source = {r['source']: r for r in (baseline or {}).get('results', [])}
+    front = pareto_front(results, k)
+
+    header = f"{'source':<10} {'P@' + str(k):>8} {'R@' + str(k):>8} {'coverage':>9} {'served':>7} {'build s':>9} {'users/s':>10}  pareto"
+    lines = [header, '-' * len(header)]
+    for r in sorted(results, key=lambda r: r[f'precision@{k}'], reverse=True):
+        lines.append(
+            f"{r['source']:<10} {r[f'precision@{k}']:>8.4f} {r[f'recall@{k}']:>8.4f} {r['coverage']:>9.3f} "
+            f"{r['user_coverage']:>7.3f} {r['build_seconds']:>9.3f} {r['users_per_second']:>10.1f}  "
+            f"{'*' if r['source'] in front else ''}"
+        )
+        old = baseline_by_source.get(r['source'])
+        if old:
+            speedup = r['users_per_second'] / old['users_per_second'] if old['users_per_second'] else float('inf')
+            lines.append(
+                f"{'  vs base':<10} {r[f'precision@{k}'] - old[f'precision@{k}']:>+8.4f} "
+                f"{r[f'recall@{k}'] - old[f'recall@{k}']:>+8.4f} {r['coverage'] - old['coverage']:>+9.3f} "
+                f"{r['user_coverage'] - old['user_coverage']:>+7.3f} {r['build_seconds'] - old['build_seconds']:>+9.3f} "
+                f"{speedup:>9.2f}x"
+            )
+    return '\n'.join(lines)
+
+def run_evaluation(interactions_df, products_df, sources=None, k=5, test_fraction=0.2, include_cold_users=False):
+    """Runs the full harness and returns the report as a JSON-serialisable dict."""
+    train_df, test_df, cutoff = time_based_split(interactions_df, test_fraction)
+    ground_truth = build_ground_truth(train_df, test_df, include_cold_users)
+
+    results = [
+        evaluate_source(name, train_df, products_df, ground_truth, k)
+        for name in (sources or list(SOURCES))
+    ]
+    return {
+        'cutoff': str(cutoff),
+        'train_interactions': len(train_df),
+        'test_interactions': len(test_df),
+        'evaluated_users': len(ground_truth),
+        'products': len(products_df),
+        'results': results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline evaluation of the recommendation sources.")
+    parser.add_argument('--sources', nargs='+', choices=list(SOURCES), help="Sources to evaluate (default: all).")
+    parser.add_argument('-k', type=int, default=5, help="Number of recommendations per user (default: 5).")
+    parser.add_argument('--test-fraction', type=float, default=0.2, help="Newest fraction of views held out (default: 0.2).")
+    parser.add_argument('--include-cold-users', action='store_true', help="Also evaluate users with no training history.")
+    parser.add_argument('--synthetic', action='store_true', help="Use generated data instead of the database.")
+    parser.add_argument('--users', type=int, default=500, help="Synthetic users (default: 500).")
+    parser.add_argument('--products', type=int, default=300, help="Synthetic products (default: 300).")
+    parser.add_argument('--interactions', type=int, default=20000, help="Synthetic interactions (default: 20000).")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic data seed (default: 42).")
+    parser.add_argument('--output', help="Write the report as JSON to this path.")
+    parser.add_argument('--baseline', help="JSON report from a previous run to compare against.")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        interactions_df, products_df = generate_dataset(args.users, args.products, args.interactions, args.seed)
+    else:
+        interactions_df, products_df = recommender.load_interaction_data()
+        if interactions_df.empty or products_df.empty:
+            parser.error("No interactions or products loaded from the database; use --synthetic to run offline.")
+
+    report = run_evaluation(
+        interactions_df, products_df, args.sources, args.k, args.test_fraction, args.include_cold_users
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"Holdout cutoff: {report['cutoff']} | train: {report['train_interactions']} | "
+          f"test: {report['test_interactions']} | users: {report['evaluated_users']} | products: {report['products']}")
+    print(format_report(report['results'], args.k, baseline))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/parallel_build.py
+# Scaling curves for the parallel model build: times the item-item neighbour table and the
+# content similarity matrix for increasing worker counts, and checks every parallel result
+# is identical to the serial build (and the content matrix to sklearn's cosine_similarity).
+#
+# Usage (from the repository root):
+#   python -m benchmarks.parallel_build --workers 1 2 4 8 16 32 --users 50000 --products 20000 --interactions 2000000
+import argparse
+import os
+import time
+
+import numpy as np
+
+def time_call(fn, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Serial vs parallel model build scaling benchmark.")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument('--block-size', type=int, default=500)
+    parser.add_argument('--top-k', type=int, default=50)
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--products', type=int, default=4000)
+    parser.add_argument('--interactions', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per point, best time is reported (default: 1).")
+    args = parser.parse_args()
+
+    # Imported here rather than at module level: pool workers re-import this module as __mp_main__,
+    # and the ML stack would otherwise be loaded again in every worker and counted in the timings.
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    import recommender
+    from benchmarks.synthetic import generate_dataset
+
+    interactions_df, products_df = generate_dataset(args.users, args.products, args.interactions)
+    user_item_sparse, _, _ = recommender.create_sparse_interaction_matrix(interactions_df)
+    print(f"{user_item_sparse.shape[0]} users x {user_item_sparse.shape[1]} items, {user_item_sparse.nnz} views; "
+          f"{len(products_df)} products; block size {args.block_size}; {os.cpu_count()} CPUs")
+
+    # Reference outputs: the serial build, and sklearn's cosine_similarity for the content matrix
+    serial_neighbours = recommender.calculate_item_neighbours(
+        user_item_sparse, top_k=args.top_k, block_size=args.block_size, workers=1
+    )
+    serial_content, _ = recommender.calculate_content_based_similarity(products_df, block_size=args.block_size, workers=1)
+    tfidf = TfidfVectorizer(stop_words='english', min_df=2).fit_transform(recommender.get_product_features(products_df))
+    print(f"Content matrix identical to cosine_similarity: {np.array_equal(serial_content, cosine_similarity(tfidf, tfidf))}")
+
+    print(f"\n{'workers':>7} {'itemcf s':>9} {'speedup':>8} {'eff':>6} {'content s':>10} {'speedup':>8} {'eff':>6}  identical")
+    base_item = base_content = None
+    for workers in args.workers:
+        item_seconds, neighbours = time_call(lambda: recommender.calculate_item_neighbours(
+            user_item_sparse, top_k=args.top_k, block_size=args.block_size, workers=workers), args.repeat)
+        content_seconds, (content, _) = time_call(lambda: recommender.calculate_content_based_similarity(
+            products_df, block_size=args.block_size, workers=workers), args.repeat)
+
+        base_item = base_item or item_seconds
+        base_content = base_content or content_seconds
+        identical = (neighbours != serial_neighbours).nnz == 0 and np.array_equal(content, serial_content)
+        item_speedup, content_speedup = base_item / item_seconds, base_content / content_seconds
+        print(f"{workers:>7} {item_seconds:>9.3f} {item_speedup:>7.2f}x {item_speedup / workers:>6.2f} "
+              f"{content_seconds:>10.3f} {content_speedup:>7.2f}x {content_speedup / workers:>6.2f}  {identical}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/startup.py
+# Measures import time of app.py and time-to-first-recommendation, with and without the
+# gunicorn warm-up. Each case runs in a fresh interpreter so nothing is already imported.
+#
+# Usage (from the repository root):
+#   python -m benchmarks.startup --users 2000 --products 1000 --interactions 100000
+import argparse
+import json
+import subprocess
+import sys
+
+# Executed in a child interpreter. The recommender's database loader is replaced by synthetic data
+# so the benchmark runs without MySQL; everything else is the real request path.
+CHILD_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import app
+import_seconds = time.perf_counter() - start
+ml_loaded_at_import = 'pandas' in sys.modules
+
+start = time.perf_counter()
+import recommender
+ml_import_seconds = time.perf_counter() - start
+
+from benchmarks.synthetic import generate_dataset
+interactions_df, products_df = generate_dataset({users}, {products}, {interactions}, seed=42)
+recommender.load_interaction_data = lambda raise_on_error=False: (interactions_df.copy(), products_df.copy())
+
+warm_up_seconds = 0.0
+if {warm}:
+    start = time.perf_counter()
+    recommender.warm_up()
+    warm_up_seconds = time.perf_counter() - start
+
+import jwt
+from datetime import datetime, timedelta
+user_id = int(interactions_df['user_id'].iloc[0])
+token = jwt.encode({{'user_id': user_id, 'username': 'bench', 'is_admin': False,
+                     'exp': datetime.utcnow() + timedelta(minutes=5), 'aud': 'ecommerce-app'}},
+                   app.app.config['SECRET_KEY'], algorithm='HS256')
+client = app.app.test_client()
+headers = {{'Authorization': f'Bearer {{token}}'}}
+
+import contextlib, io
+timings = []
+for _ in range(2):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = client.get(f'/recommendations/{{user_id}}', headers=headers)
+    timings.append(time.perf_counter() - start)
+    assert response.status_code == 200, response.get_data(as_text=True)
+
+print(json.dumps({{
+    'import_seconds': import_seconds,
+    'ml_loaded_at_import': ml_loaded_at_import,
+    'ml_import_seconds': ml_import_seconds,
+    'warm_up_seconds': warm_up_seconds,
+    'first_request_seconds': timings[0],
+    'second_request_seconds': timings[1],
+}}))
+'''
+
+def run_case(warm, users, products, interactions):
+    script = CHILD_SCRIPT.format(warm=warm, users=users, products=products, interactions=interactions)
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time and time-to-first-recommendation benchmark.")
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--interactions', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per case (default: 3).")
+    args = parser.parse_args()
+
+    # 'worker TTFR' is how long a freshly forked worker takes to answer its first /recommendations call.
+    # Without warm-up it pays the ML import and the model build itself; with --preload the master has paid both.
+    print(f"{'case':<22} {'app import s':>12} {'ML at import':>13} {'ML import s':>12} {'warm-up s':>10} "
+          f"{'1st req s':>10} {'2nd req s':>10} {'worker TTFR s':>14}")
+    for label, warm in (('cold (no warm-up)', False), ('preloaded (warm-up)', True)):
+        runs = [run_case(warm, args.users, args.products, args.interactions) for _ in range(args.repeat)]
+        best = {key: min(r[key] for r in runs) for key in runs[0] if key != 'ml_loaded_at_import'}
+        worker_ttfr = best['first_request_seconds'] + (0.0 if warm else best['ml_import_seconds'])
+        print(f"{label:<22} {best['import_seconds']:>12.3f} {str(runs[0]['ml_loaded_at_import']):>13} "
+              f"{best['ml_import_seconds']:>12.3f} {best['warm_up_seconds']:>10.3f} {best['first_request_seconds']:>10.3f} "
+              f"{best['second_request_seconds']:>10.3f} {worker_ttfr:>14.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/synthetic.py
+# Generates synthetic products and user interactions shaped like the ones in the database,
+# so the evaluation and benchmark scripts can run without a MySQL server.
+import numpy as np
+import pandas as pd
+
+CATEGORY_VOCABULARY = {
+    'Electronics': ['laptop', 'monitor', 'display', 'processor', 'screen', 'battery', 'portable', 'ultra'],
+    'Accessories': ['keyboard', 'mouse', 'wireless', 'ergonomic', 'cable', 'adapter', 'usb', 'rgb'],
+    'Audio': ['headphones', 'speaker', 'bass', 'noise', 'cancelling', 'bluetooth', 'sound', 'studio'],
+    'Gaming': ['console', 'controller', 'gaming', 'graphics', 'fps', 'headset', 'arcade', 'joystick'],
+    'Home': ['lamp', 'smart', 'thermostat', 'camera', 'security', 'plug', 'assistant', 'hub'],
+    'Storage': ['ssd', 'drive', 'external', 'backup', 'terabyte', 'flash', 'nvme', 'enclosure'],
+    'Office': ['printer', 'scanner', 'desk', 'chair', 'paper', 'shredder', 'whiteboard', 'stapler'],
+    'Mobile': ['phone', 'tablet', 'charger', 'case', 'screen', 'protector', 'stylus', 'mount'],
+}
+
+def generate_products(n_products, rng):
+    """Returns a products DataFrame with the same columns as the 'products' table."""
+    categories = list(CATEGORY_VOCABULARY)
+    product_categories = rng.choice(categories, size=n_products)
+    rows = []
+    for i, category in enumerate(product_categories, start=1):
+        words = rng.choice(CATEGORY_VOCABULARY[category], size=6)
+        rows.append({
+            'id': i,
+            'name': f"{category} item {i}",
+            'description': ' '.join(words),
+            'price': float(round(rng.uniform(5, 1500), 2)),
+            'category': category,
+            'image_url': f"https://example.com/images/{i}.jpg",
+            'stock_quantity': int(rng.integers(0, 500)),
+        })
+    return pd.DataFrame(rows)
+
+def generate_interactions(products_df, n_users, n_interactions, rng, days=90):
+    """
+    Returns a 'view' interactions DataFrame with the same columns as load_interaction_data().
+    Each user prefers one or two categories, and product popularity follows a Zipf-like curve,
+    so there is real signal for the collaborative and content-based engines to find.
+    """
+    product_ids = products_df['id'].to_numpy()
+    categories = products_df['category'].to_numpy()
+    category_names = list(CATEGORY_VOCABULARY)
+
+    popularity = 1.0 / np.arange(1, len(product_ids) + 1) ** 0.8
+    popularity = popularity[rng.permutation(len(product_ids))]
+
+    per_category = {
+        c: (product_ids[categories == c], popularity[categories == c] / popularity[categories == c].sum())
+        for c in category_names if (categories == c).any()
+    }
+    global_weights = popularity / popularity.sum()
+
+    user_ids = rng.integers(1, n_users + 1, size=n_interactions)
+    user_preferences = {
+        u: rng.choice(list(per_category), size=rng.integers(1, 3), replace=False)
+        for u in range(1, n_users + 1)
+    }
+
+    chosen_products = np.empty(n_interactions, dtype=np.int64)
+    for i, u in enumerate(user_ids):
+        if rng.random() < 0.8:
+            ids, weights = per_category[rng.choice(user_preferences[u])]
+            chosen_products[i] = rng.choice(ids, p=weights)
+        else:
+            chosen_products[i] = rng.choice(product_ids, p=global_weights)
+
+    start = pd.Timestamp('2024-01-01')
+    offsets = pd.to_timedelta(rng.uniform(0, days * 86400, size=n_interactions), unit='s')
+
+    interactions_df = pd.DataFrame({
+        'user_id': user_ids,
+        'product_id': chosen_products,
+        'interaction_type': 'view',
+        'interaction_value': 1,
+        'interaction_time': start + offsets,
+    })
+    return interactions_df.sort_values('interaction_time').reset_index(drop=True)
+
+def generate_dataset(n_users=500, n_products=300, n_interactions=20000, seed=42):
+    """Returns (interactions_df, products_df) in the same shape as load_interaction_data()."""
+    rng = np.random.default_rng(seed)
+    products_df = generate_products(n_products, rng)
+    interactions_df = generate_interactions(products_df, n_users, n_interactions, rng)
+    return interactions_df, products_df
@@ -21,4 +21,36 @@ class config:
     # Render often sets FLASK_ENV to 'production' automatically.
     FLASK_ENV = os.getenv('FLASK_ENV', 'development')
     DEBUG = FLASK_ENV == 'development' # Debug mode should only be on in development
-    TESTING = False
\ No newline at end of file
+    TESTING = False
+
+    # Maximum number of verified JWTs cached per worker by jwt_required (see token_cache.py)
+    TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', '10000'))
+    # Seconds a cached token is trusted before the shared revocation tables in MySQL are checked again
+    TOKEN_REVOCATION_CHECK_TTL = float(os.getenv('TOKEN_REVOCATION_CHECK_TTL', '5'))
+
+    # Recommendation model:
+    # Under gunicorn the model (user-item matrix, content similarity) is built in the master and shared
+    # copy-on-write by the workers; send the master SIGHUP to rebuild it there and replace the workers.
+    # Setting this to N > 0 also lets each worker rebuild its own copy once the model is N seconds old.
+    # That refreshes without a reload, but every worker then holds a private copy of the model and pays the
+    # full database load and similarity build on a serving thread, competing with /login and /products.
+    # 0 (default) never rebuilds inside a worker.
+    RECOMMENDER_MODEL_MAX_AGE = int(os.getenv('RECOMMENDER_MODEL_MAX_AGE', '0'))
+    # Order in which recommendation sources are tried until one returns results.
+    # Sources: itemcf (item-item CF), ubcf (user-based CF), content (content-based), popular.
+    # A request can put one source first with /recommendations/<user_id>?source=<name>.
+    RECOMMENDATION_FALLBACK_ORDER = os.getenv('RECOMMENDATION_FALLBACK_ORDER', 'ubcf,content,popular')
+    # Item-item CF: neighbours kept per item in the neighbour table
+    ITEMCF_NEIGHBOURS = int(os.getenv('ITEMCF_NEIGHBOURS', '50'))
+    # Model build: similarity and top-k neighbours are computed in blocks of this many rows.
+    # With more than one worker the blocks run in a process pool (see parallel_build.py); the output is the same.
+    MODEL_BUILD_WORKERS = int(os.getenv('MODEL_BUILD_WORKERS', '1'))
+    MODEL_BUILD_BLOCK_SIZE = int(os.getenv('MODEL_BUILD_BLOCK_SIZE', '1000'))
+    # Recommendation serving: requests are computed on a dedicated pool of this many threads, with at most
+    # RECOMMENDATION_QUEUE_SIZE more waiting. A request that misses RECOMMENDATION_TIMEOUT (seconds), or arrives
+    # when the queue is full, gets the user's last result or popular items instead.
+    RECOMMENDATION_WORKERS = int(os.getenv('RECOMMENDATION_WORKERS', '4'))
+    RECOMMENDATION_QUEUE_SIZE = int(os.getenv('RECOMMENDATION_QUEUE_SIZE', '16'))
+    RECOMMENDATION_TIMEOUT = float(os.getenv('RECOMMENDATION_TIMEOUT', '2.0'))
+    # Build the model in the gunicorn master before forking workers and on SIGHUP (see gunicorn.conf.py).
+    RECOMMENDER_WARM_UP = os.getenv('RECOMMENDER_WARM_UP', 'true').lower() == 'true'
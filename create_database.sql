@@ -93,4 +93,17 @@ ALTER TABLE user_interactions
 ADD CONSTRAINT user_interactions_ibfk_2
 FOREIGN KEY (product_id)
 REFERENCES products (id)
-ON DELETE CASCADE;
\ No newline at end of file
+ON DELETE CASCADE;
+
+-- Token revocations, checked by every gunicorn worker (see /logout and /users/<id>/revoke-tokens in app.py).
+-- Times are Unix timestamps in seconds, as in the JWT 'exp' and 'iat' claims.
+create table revoked_tokens(
+	token_hash char(64) primary key, -- SHA-256 of the token
+    expires_at double not null -- Rows past this time can be deleted; the token has expired anyway
+);
+
+create table user_token_revocations(
+	user_id int primary key,
+    revoked_at double not null, -- Tokens of this user issued at or before this time are rejected
+    foreign key (user_id) references users(id) on delete cascade
+);
@@ -0,0 +1,43 @@
+# gunicorn.conf.py
+# Picked up automatically by `gunicorn app:app` when started from the repository root.
+import os
+
+# Not imported as `config`: gunicorn reads top-level names here as settings, and `config` is one of them
+from config import config as app_config
+
+# Import app.py once in the master instead of once per worker.
+preload_app = True
+
+# Threaded workers, so a request waiting on /recommendations holds one thread and not the whole worker.
+# A waiting request also holds a slot of the recommendation executor (RECOMMENDATION_WORKERS running +
+# RECOMMENDATION_QUEUE_SIZE queued; further requests are shed at once), so with more threads than slots
+# at least GUNICORN_RESERVED_THREADS threads per worker always stay free for /login, /products, etc.
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+threads = int(os.getenv(
+    'GUNICORN_THREADS',
+    str(app_config.RECOMMENDATION_WORKERS + app_config.RECOMMENDATION_QUEUE_SIZE
+        + int(os.getenv('GUNICORN_RESERVED_THREADS', '4')))
+))
+
+def build_recommendation_model(server):
+    # Runs in the master, which is single-threaded, so the build never competes with request threads
+    if not app_config.RECOMMENDER_WARM_UP:
+        return
+    try:
+        from app import get_recommender
+        get_recommender().warm_up()
+    except Exception as e:
+        # On startup, workers build the model on their first /recommendations request instead;
+        # on reload, the new workers keep the model the master already had
+        print(f"Recommendation model warm-up failed: {e}")
+
+def when_ready(server):
+    # Runs in the master after the app is preloaded and before any worker is forked,
+    # so the recommendation model is built once and shared copy-on-write by all workers.
+    build_recommendation_model(server)
+
+def on_reload(server):
+    # `kill -HUP <master pid>` (e.g. from cron) refreshes the model: it is rebuilt here in the master,
+    # then gunicorn forks new workers that share it and gracefully stops the old ones.
+    build_recommendation_model(server)
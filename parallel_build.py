@@ -0,0 +1,220 @@
+# parallel_build.py
+# Row-block kernels for building the recommendation model, run either in-process (serial build)
+# or in a process pool (parallel build). In the parallel build the input matrix lives in shared
+# memory and workers write dense output blocks into shared staging slots, so neither travels as a
+# pickled copy. Both builds run the same kernel on the same rows, so their output is identical.
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse as sp
+
+# --- SHARED MEMORY HELPERS ---
+
+def _share_array(array):
+    """Copies an array into a new shared memory block. Returns (shm, spec) where spec lets other processes attach."""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+def _attach_array(spec):
+    """Attaches to an array shared with _share_array(). Returns (shm, array view); keep shm alive while using the view."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+# --- KERNELS ---
+# Each kernel handles the rows [start, stop) of a CSR matrix against all of its rows.
+
+def top_k_block(matrix, norms, start, stop, top_k):
+    """
+    Scores rows [start, stop) against all rows and keeps the top_k neighbours of each row.
+    The sparse product gives co-occurrence counts; dividing by both rows' norms gives cosine similarity.
+    Returns (rows, cols, scores) in COO form.
+    """
+    co_occurrence = (matrix[start:stop] @ matrix.T).tocsr()
+    co_occurrence.sort_indices()
+
+    rows, cols, scores = [], [], []
+    for r in range(stop - start):
+        item = start + r
+        lo, hi = co_occurrence.indptr[r], co_occurrence.indptr[r + 1]
+        neighbours = co_occurrence.indices[lo:hi]
+        counts = co_occurrence.data[lo:hi]
+
+        not_self = neighbours != item
+        neighbours, counts = neighbours[not_self], counts[not_self]
+        if len(neighbours) == 0:
+            continue
+
+        cosine = counts / (norms[item] * norms[neighbours])
+        # Highest score first, ties broken by column so the table is deterministic
+        order = np.lexsort((neighbours, -cosine))[:top_k]
+        rows.append(np.full(len(order), item, dtype=np.int64))
+        cols.append(neighbours[order].astype(np.int64))
+        scores.append(cosine[order])
+
+    if not rows:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64), np.array([], dtype=np.float64)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(scores)
+
+def similarity_block(matrix, start, stop):
+    """Dense rows [start, stop) of matrix @ matrix.T (cosine similarity when the rows are L2-normalised)."""
+    return (matrix[start:stop] @ matrix.T).toarray()
+
+# --- PROCESS POOL WORKERS ---
+
+# Set in each worker by _init_worker: the shared input matrix (and norms/staging slots) attached once per process
+_worker_state = {}
+
+def _init_worker(matrix_specs, shape, norms_spec, staging_spec):
+    handles = []
+    arrays = []
+    for spec in matrix_specs:
+        shm, array = _attach_array(spec)
+        handles.append(shm)
+        arrays.append(array)
+    data, indices, indptr = arrays
+    _worker_state['matrix'] = sp.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+    if norms_spec is not None:
+        shm, _worker_state['norms'] = _attach_array(norms_spec)
+        handles.append(shm)
+    if staging_spec is not None:
+        shm, _worker_state['staging'] = _attach_array(staging_spec)
+        handles.append(shm)
+    _worker_state['handles'] = handles # Keep the mappings open for the worker's lifetime
+
+def _top_k_task(start, stop, top_k):
+    return top_k_block(_worker_state['matrix'], _worker_state['norms'], start, stop, top_k)
+
+def _similarity_task(start, stop, slot):
+    # Written straight into a shared staging slot; nothing but the block bounds travels back
+    _worker_state['staging'][slot, :stop - start] = similarity_block(_worker_state['matrix'], start, stop)
+    return start, stop, slot
+
+# pid of the process that last used the fork server. A process forked from it (e.g. a gunicorn worker forked
+# from the master that ran the warm-up build) inherits the server's handle but isn't its parent, so it can't
+# wait on it; such a process has to start a fork server of its own.
+_fork_server_owner = None
+
+def _forget_inherited_fork_server():
+    """Drops the fork server handle inherited through fork(), so the next pool starts a new server in this process."""
+    from multiprocessing import forkserver
+    server = forkserver._forkserver
+    if server._forkserver_alive_fd is not None:
+        os.close(server._forkserver_alive_fd) # Our copy only; the parent still holds its own
+    server._forkserver_address = None
+    server._forkserver_alive_fd = None
+    server._forkserver_pid = None
+
+def _get_pool_context():
+    """
+    Not plain fork: the build may run from a thread of a serving process (model rebuild), and forking a
+    threaded process is unsafe. The fork server preloads only this module, so workers start without
+    re-importing pandas/scikit-learn from __main__; spawn is the fallback where it isn't available.
+    """
+    global _fork_server_owner
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        if _fork_server_owner is not None and _fork_server_owner != os.getpid():
+            _forget_inherited_fork_server()
+        _fork_server_owner = os.getpid()
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+@contextmanager
+def _shared_pool(matrix, workers, norms=None, staging_shape=None):
+    """
+    Shares the matrix (and norms / a float64 staging array) in shared memory and starts a process pool
+    whose workers attach to them. Yields (executor, staging array or None); everything is freed on exit.
+    """
+    matrix = matrix.tocsr()
+    shared = []
+    try:
+        matrix_specs = []
+        for array in (matrix.data, matrix.indices, matrix.indptr):
+            shm, spec = _share_array(array)
+            shared.append(shm)
+            matrix_specs.append(spec)
+
+        norms_spec = None
+        if norms is not None:
+            shm, norms_spec = _share_array(norms)
+            shared.append(shm)
+
+        staging_spec = staging = None
+        if staging_shape is not None:
+            shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(staging_shape)) * 8, 1))
+            shared.append(shm)
+            staging_spec = (shm.name, staging_shape, np.dtype(np.float64).str)
+            staging = np.ndarray(staging_shape, dtype=np.float64, buffer=shm.buf)
+
+        context = _get_pool_context()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(matrix_specs, matrix.shape, norms_spec, staging_spec)) as executor:
+            yield executor, staging
+    finally:
+        for shm in shared:
+            shm.close()
+            shm.unlink()
+
+# --- PUBLIC ENTRY POINTS ---
+
+def row_blocks(n_rows, block_size):
+    return [(start, min(start + block_size, n_rows)) for start in range(0, n_rows, block_size)]
+
+def row_block_top_k(matrix, norms, top_k, workers=1, block_size=1000):
+    """
+    Top-k cosine neighbours of every row of a sparse matrix, computed in row blocks.
+    Returns an n_rows x n_rows CSR matrix whose row i holds the neighbour scores of row i.
+    """
+    matrix = matrix.tocsr()
+    n_rows = matrix.shape[0]
+    blocks = row_blocks(n_rows, block_size)
+
+    if workers > 1 and len(blocks) > 1:
+        with _shared_pool(matrix, workers, norms=norms) as (executor, _):
+            results = list(executor.map(_top_k_task, *zip(*[(start, stop, top_k) for start, stop in blocks])))
+    else:
+        results = [top_k_block(matrix, norms, start, stop, top_k) for start, stop in blocks]
+
+    rows = np.concatenate([r[0] for r in results])
+    cols = np.concatenate([r[1] for r in results])
+    scores = np.concatenate([r[2] for r in results])
+    return sp.csr_matrix((scores, (rows, cols)), shape=(n_rows, n_rows))
+
+def row_block_similarity(matrix, workers=1, block_size=1000):
+    """
+    Dense matrix @ matrix.T computed in row blocks, in a process pool when workers > 1.
+    The result is the only n_rows x n_rows array: pool workers fill one block-sized shared staging slot each,
+    and each block is copied into the result as soon as it is done, freeing the slot for the next block.
+    """
+    matrix = matrix.tocsr()
+    n_rows = matrix.shape[0]
+    blocks = row_blocks(n_rows, block_size)
+    out = np.empty((n_rows, n_rows), dtype=np.float64)
+
+    if workers > 1 and len(blocks) > 1:
+        n_slots = min(workers, len(blocks))
+        with _shared_pool(matrix, workers, staging_shape=(n_slots, block_size, n_rows)) as (executor, staging):
+            todo = list(reversed(blocks))
+            pending = set()
+            for slot in range(n_slots):
+                pending.add(executor.submit(_similarity_task, *todo.pop(), slot))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    start, stop, slot = future.result()
+                    out[start:stop] = staging[slot, :stop - start]
+                    if todo:
+                        pending.add(executor.submit(_similarity_task, *todo.pop(), slot))
+        return out
+
+    for start, stop in blocks:
+        out[start:stop] = similarity_block(matrix, start, stop)
+    return out
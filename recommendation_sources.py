@@ -0,0 +1,48 @@
+# recommendation_sources.py
+# Names of the recommendation sources and the order they are tried in. Kept apart from recommender.py
+# so app.py can validate ?source= without importing pandas, numpy or scikit-learn.
+from config import config
+
+# Names accepted by ?source= and RECOMMENDATION_FALLBACK_ORDER, with the label shown in the API response
+RECOMMENDATION_SOURCES = {
+    'itemcf': "Item-Item CF",
+    'ubcf': "UBCF",
+    'content': "Content-Based",
+    'popular': "Popular Items",
+}
+
+DEFAULT_FALLBACK_ORDER = ['ubcf', 'content', 'popular']
+
+def parse_fallback_order(value):
+    """
+    Parses a comma-separated fallback order such as 'itemcf,ubcf,content,popular'.
+    Names are case-insensitive; unknown names are skipped with a warning, and if none are valid
+    DEFAULT_FALLBACK_ORDER is used, so a typo in the setting can't break /recommendations.
+    """
+    order = []
+    for name in value.split(','):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in RECOMMENDATION_SOURCES:
+            print(f"Warning: ignoring unknown recommendation source '{name}' in RECOMMENDATION_FALLBACK_ORDER. "
+                  f"Valid sources: {', '.join(RECOMMENDATION_SOURCES)}")
+        elif name not in order:
+            order.append(name)
+    if not order:
+        print(f"Warning: RECOMMENDATION_FALLBACK_ORDER has no valid sources, using {','.join(DEFAULT_FALLBACK_ORDER)}.")
+        order = list(DEFAULT_FALLBACK_ORDER)
+    return order
+
+# Parsed and validated once, when this module is first imported
+FALLBACK_ORDER = parse_fallback_order(config.RECOMMENDATION_FALLBACK_ORDER)
+
+def get_fallback_order(preferred_source=None):
+    """
+    Returns the order in which sources are tried: FALLBACK_ORDER (from config.RECOMMENDATION_FALLBACK_ORDER),
+    with preferred_source (if given) moved to the front.
+    """
+    order = list(FALLBACK_ORDER)
+    if preferred_source:
+        order = [preferred_source] + [s for s in order if s != preferred_source]
+    return order
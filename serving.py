@@ -0,0 +1,110 @@
+# serving.py
+# Bounded executor for the /recommendations route. Recommendation work runs on its own small
+# thread pool with a per-request deadline, so a burst of slow computations can't hold every
+# gunicorn worker thread; when the pool and its queue are full, new requests are shed instead of queued.
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class QueueFullError(Exception):
+    """Raised by BoundedExecutor.submit() when the pool and its queue are both full."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool with admission control: at most max_workers tasks run and at most max_queue wait.
+    Tracks queue depth, queue wait time and run time for stats().
+    """
+
+    def __init__(self, max_workers=4, max_queue=16, name='recommendations'):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) and returns its Future, or raises QueueFullError without waiting."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise QueueFullError(f"{self.max_workers} running and {self.max_queue} queued")
+
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self.submitted += 1
+
+        def run():
+            started_at = time.perf_counter()
+            wait = started_at - submitted_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.completed += 1
+                    self._total_run += time.perf_counter() - started_at
+                self._slots.release()
+
+        return self._executor.submit(run)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timed_out += 1
+
+    def stats(self):
+        with self._lock:
+            started = self.completed + self._running
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'queue_depth': self._queued,
+                'running': self._running,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'avg_wait_ms': 1000 * self._total_wait / started if started else 0.0,
+                'max_wait_ms': 1000 * self._max_wait,
+                'avg_run_ms': 1000 * self._total_run / self.completed if self.completed else 0.0,
+            }
+
+
+class RecentResults:
+    """Bounded LRU of the last recommendations computed per user, served when a request misses its deadline."""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            result = self._entries.get(user_id)
+            if result is not None:
+                self._entries.move_to_end(user_id)
+            return result
+
+    def put(self, user_id, result):
+        with self._lock:
+            self._entries[user_id] = result
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
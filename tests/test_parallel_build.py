@@ -0,0 +1,72 @@
+# tests/test_parallel_build.py
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+
+import parallel_build
+
+
+def make_matrix(n_rows=40, n_cols=30, density=0.2, seed=0):
+    rng = np.random.default_rng(seed)
+    return sp.csr_matrix((rng.random((n_rows, n_cols)) < density).astype(np.float64))
+
+
+def row_norms(matrix):
+    return np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+
+
+def test_top_k_is_identical_serial_and_parallel():
+    matrix = make_matrix()
+    norms = row_norms(matrix)
+    serial = parallel_build.row_block_top_k(matrix, norms, 5, workers=1, block_size=7)
+    parallel = parallel_build.row_block_top_k(matrix, norms, 5, workers=2, block_size=7)
+
+    assert (serial != parallel).nnz == 0
+    assert np.array_equal(serial.indptr, parallel.indptr) and np.array_equal(serial.indices, parallel.indices)
+
+
+def test_top_k_matches_cosine_similarity():
+    matrix = make_matrix()
+    neighbours = parallel_build.row_block_top_k(matrix, row_norms(matrix), 40, workers=2, block_size=7)
+
+    expected = cosine_similarity(matrix)
+    np.fill_diagonal(expected, 0.0)
+    assert np.allclose(neighbours.toarray(), expected)
+
+
+def test_similarity_is_identical_serial_and_parallel_and_matches_cosine_similarity():
+    matrix = normalize(make_matrix())
+    serial = parallel_build.row_block_similarity(matrix, workers=1, block_size=7)
+    parallel = parallel_build.row_block_similarity(matrix, workers=2, block_size=7)
+
+    assert np.array_equal(serial, parallel)
+    # cosine_similarity re-normalises the rows, so it can differ in the last bits
+    assert np.allclose(serial, cosine_similarity(matrix, matrix), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="needs os.fork")
+def test_parallel_build_works_in_a_process_forked_after_a_parallel_build():
+    # Regression: a gunicorn worker forked from a master that already ran a parallel build inherited the
+    # master's fork server handle and failed with ChildProcessError on its own build.
+    matrix = make_matrix()
+    norms = row_norms(matrix)
+    expected = parallel_build.row_block_top_k(matrix, norms, 5, workers=2, block_size=10)
+
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            result = parallel_build.row_block_top_k(matrix, norms, 5, workers=2, block_size=10)
+            code = 0 if (result != expected).nnz == 0 else 2
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+    # The parent's own fork server still works after the child started its own
+    result = parallel_build.row_block_top_k(matrix, norms, 5, workers=2, block_size=10)
+    assert (result != expected).nnz == 0
@@ -0,0 +1,94 @@
+# tests/test_recommender.py
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.metrics.pairwise import cosine_similarity
+
+import recommender
+
+
+def test_parse_fallback_order_accepts_known_sources_case_insensitively():
+    assert recommender.parse_fallback_order('itemCF, ubcf,popular') == ['itemcf', 'ubcf', 'popular']
+
+
+def test_parse_fallback_order_skips_unknown_sources():
+    assert recommender.parse_fallback_order('itemcff,content,content,popular') == ['content', 'popular']
+
+
+def test_parse_fallback_order_falls_back_to_default_when_nothing_is_valid():
+    assert recommender.parse_fallback_order('bogus,,') == recommender.DEFAULT_FALLBACK_ORDER
+
+
+def test_preferred_source_is_tried_first():
+    order = recommender.get_fallback_order('itemcf')
+    assert order[0] == 'itemcf'
+    assert order[1:] == [s for s in recommender.FALLBACK_ORDER if s != 'itemcf']
+
+
+def test_ubcf_ranks_by_summed_similarity_of_similar_users():
+    views = [(1, 10), (1, 20), (2, 10), (2, 20), (2, 30), (3, 10), (3, 40), (4, 50)]
+    interactions_df = pd.DataFrame(
+        [(u, p, 'view', 1) for u, p in views],
+        columns=['user_id', 'product_id', 'interaction_type', 'interaction_value'],
+    )
+    user_item_matrix, _ = recommender.create_user_item_matrix(interactions_df)
+
+    # User 2 (similarity 0.82) viewed 30, user 3 (0.5) viewed 40, user 4 (0.0) viewed 50
+    assert recommender.get_ubcf_recommendations(1, user_item_matrix, top_n=5) == [30, 40, 50]
+
+
+def make_item_cf_model(neighbour_rows, product_ids, user_items):
+    """Item CF model with a hand-written neighbour table: neighbour_rows maps a column to {column: score}."""
+    n = len(product_ids)
+    rows, cols, scores = [], [], []
+    for row, neighbours in neighbour_rows.items():
+        for col, score in neighbours.items():
+            rows.append(row)
+            cols.append(col)
+            scores.append(score)
+    return {
+        'neighbours': sp.csr_matrix((scores, (rows, cols)), shape=(n, n)),
+        'product_ids': np.asarray(product_ids),
+        'user_items': {user_id: np.asarray(items) for user_id, items in user_items.items()},
+    }
+
+
+def test_item_cf_ranks_by_summed_score_and_excludes_viewed_items():
+    model = make_item_cf_model(
+        {0: {1: 0.9, 2: 0.5, 3: 0.3}, 1: {0: 0.9, 3: 0.4, 4: 0.1}},
+        [100, 200, 300, 400, 500],
+        {1: [0, 1]},
+    )
+    # 400: 0.3 + 0.4, 300: 0.5, 500: 0.1; 100 and 200 were viewed
+    assert recommender.get_item_cf_recommendations(1, model, top_n=5) == [400, 300, 500]
+
+
+def test_item_cf_breaks_ties_by_product_id():
+    model = make_item_cf_model({0: {3: 0.5, 1: 0.5, 2: 0.5}}, [100, 200, 300, 400], {1: [0]})
+    assert recommender.get_item_cf_recommendations(1, model, top_n=2) == [200, 300]
+
+
+def test_item_cf_returns_nothing_for_a_cold_user():
+    model = make_item_cf_model({0: {1: 0.5}}, [100, 200], {1: [0]})
+    assert recommender.get_item_cf_recommendations(2, model) == []
+
+
+def test_item_neighbours_match_cosine_similarity_without_self():
+    rng = np.random.default_rng(0)
+    user_item = sp.csr_matrix((rng.random((30, 12)) < 0.3).astype(np.float64))
+    neighbours = recommender.calculate_item_neighbours(user_item, top_k=12, block_size=5).toarray()
+
+    expected = cosine_similarity(user_item.T)
+    np.fill_diagonal(expected, 0.0)
+    assert np.allclose(neighbours, expected)
+
+
+def test_item_neighbours_keep_top_k_with_ties_broken_by_column():
+    # Item 0 is viewed with items 1, 2 and 3 by one user each, so all three tie
+    user_item = sp.csr_matrix(np.array([
+        [1, 1, 0, 0],
+        [1, 0, 1, 0],
+        [1, 0, 0, 1],
+    ], dtype=np.float64))
+    neighbours = recommender.calculate_item_neighbours(user_item, top_k=2, block_size=2)
+    assert neighbours[0].indices.tolist() == [1, 2]
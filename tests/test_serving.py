@@ -0,0 +1,81 @@
+# tests/test_serving.py
+import threading
+import types
+from datetime import datetime
+
+import jwt
+import pandas as pd
+import pytest
+
+from serving import BoundedExecutor, QueueFullError, RecentResults
+
+
+def test_requests_are_shed_when_workers_and_queue_are_full():
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = executor.submit(release.wait)
+    queued = executor.submit(release.wait)
+
+    with pytest.raises(QueueFullError):
+        executor.submit(release.wait)
+    assert executor.stats()['rejected'] == 1
+
+    release.set()
+    assert running.result(timeout=5) and queued.result(timeout=5)
+
+
+def test_slots_are_freed_after_completion():
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+    for _ in range(5):
+        # Each round fills every slot; it only fits if the previous round's slots were released
+        futures = [executor.submit(lambda: 42) for _ in range(2)]
+        assert [f.result(timeout=5) for f in futures] == [42, 42]
+
+    stats = executor.stats()
+    assert stats['completed'] == 10 and stats['rejected'] == 0
+    assert stats['queue_depth'] == 0 and stats['running'] == 0
+
+
+def test_recent_results_evicts_least_recently_used_user():
+    results = RecentResults(max_size=2)
+    results.put(1, ([10], "UBCF"))
+    results.put(2, ([20], "UBCF"))
+    results.get(1)
+    results.put(3, ([30], "UBCF"))
+
+    assert results.get(2) is None
+    assert results.get(1) == ([10], "UBCF")
+
+
+def test_missed_deadline_serves_the_users_last_result(monkeypatch):
+    import app as app_module
+
+    release = threading.Event()
+    products_df = pd.DataFrame({'id': [10, 20, 30], 'name': ['a', 'b', 'c'], 'price': [1.0, 2.0, 3.0]})
+    model = {'products_df': products_df, 'popular_product_ids': [10, 20, 30]}
+
+    monkeypatch.setattr(app_module, 'recommendation_executor', BoundedExecutor(max_workers=1, max_queue=1))
+    monkeypatch.setattr(app_module, 'recent_recommendations', RecentResults())
+    monkeypatch.setattr(app_module, 'compute_recommendations', lambda user_id, source: release.wait(5))
+    monkeypatch.setattr(app_module, 'get_loaded_recommender',
+                        lambda: types.SimpleNamespace(get_cached_model=lambda: model))
+    monkeypatch.setitem(app_module.app.config, 'RECOMMENDATION_TIMEOUT', 0.05)
+    monkeypatch.setattr(app_module.token_cache, '_revocation_check', None) # No MySQL here
+    app_module.recent_recommendations.put(1, ([30, 10], "UBCF"))
+
+    token = jwt.encode(
+        {'user_id': 1, 'username': 'user', 'is_admin': False, 'exp': datetime.utcnow() + app_module.TOKEN_LIFETIME,
+         'iat': datetime.utcnow(), 'aud': "ecommerce-app"},
+        app_module.app.config['SECRET_KEY'], algorithm='HS256',
+    )
+    try:
+        response = app_module.app.test_client().get(
+            '/recommendations/1', headers={'Authorization': f'Bearer {token}'}
+        )
+    finally:
+        release.set()
+
+    assert response.status_code == 200
+    assert "UBCF (cached, deadline exceeded)" in response.json['message']
+    assert [p['id'] for p in response.json['recommended_products']] == [30, 10]
+    assert app_module.recommendation_executor.stats()['timed_out'] == 1
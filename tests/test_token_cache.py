@@ -0,0 +1,126 @@
+# tests/test_token_cache.py
+import time
+
+from token_cache import TokenCache
+
+
+def make_claims(user_id=1, iat=None, exp_in=3600):
+    now = int(time.time())
+    return {'user_id': user_id, 'username': 'user', 'is_admin': True,
+            'iat': now if iat is None else iat, 'exp': now + exp_in}
+
+
+def test_cached_claims_are_returned_until_expiry():
+    cache = TokenCache(max_size=10)
+    cache.put('live', make_claims())
+    cache.put('expired', make_claims(exp_in=-1))
+
+    assert cache.get('live')['user_id'] == 1
+    assert cache.get('expired') is None
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TokenCache(max_size=2)
+    cache.put('a', make_claims())
+    cache.put('b', make_claims())
+    cache.get('a')
+    cache.put('c', make_claims())
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_logout_revokes_the_token():
+    cache = TokenCache()
+    token = 'header.payload.signature'
+    digest = cache.digest(token)
+    claims = make_claims()
+    cache.put(digest, claims)
+
+    cache.revoke_token(token, claims['exp'])
+
+    assert cache.get(digest) is None
+    assert cache.is_revoked(digest, claims)
+
+
+def test_revoke_user_rejects_token_issued_in_the_same_second():
+    # Regression: 'iat' is whole seconds, so a token issued just before the revocation
+    # in the same wall-clock second must still be rejected.
+    cache = TokenCache()
+    claims = make_claims(user_id=7)
+    cache.put('token', claims)
+
+    cache.revoke_user(7)
+
+    assert cache.get('token') is None
+    assert cache.is_revoked('token', claims)
+
+
+def test_revoke_user_accepts_tokens_issued_later():
+    cache = TokenCache()
+    cache.revoke_user(7)
+
+    assert not cache.is_revoked('new-token', make_claims(user_id=7, iat=int(time.time()) + 1))
+    assert not cache.is_revoked('other-user', make_claims(user_id=8))
+
+
+def test_revocation_check_hook_is_consulted():
+    cache = TokenCache()
+    cache.set_revocation_check(lambda digest, claims: digest == 'denied')
+
+    assert cache.is_revoked('denied', make_claims())
+    assert not cache.is_revoked('allowed', make_claims())
+
+
+def test_revocation_check_is_cached_for_check_ttl(monkeypatch):
+    calls = []
+    cache = TokenCache(check_ttl=5)
+    cache.set_revocation_check(lambda digest, claims: calls.append(digest) or False)
+    claims = make_claims()
+    cache.put('token', claims)
+    cache.is_revoked('token', claims)
+    cache.is_revoked('token', claims)
+    assert calls == ['token']
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 6)
+    cache.is_revoked('token', claims)
+    assert calls == ['token', 'token']
+
+
+def test_revocation_check_runs_again_on_a_cache_miss():
+    calls = []
+    cache = TokenCache(check_ttl=60)
+    cache.set_revocation_check(lambda digest, claims: calls.append(digest) or False)
+    claims = make_claims()
+    cache.is_revoked('token', claims)
+
+    assert cache.get('token') is None # Not cached, so the next check can't be skipped
+    cache.is_revoked('token', claims)
+    assert calls == ['token', 'token']
+
+
+def test_old_user_revocations_are_pruned(monkeypatch):
+    cache = TokenCache(max_token_age=60)
+    cache.revoke_user(7)
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    cache.revoke_user(8)
+
+    assert cache.stats()['revoked_users'] == 1
+    assert not cache.is_revoked('token', make_claims(user_id=7, iat=int(now) - 10))
+
+
+def test_stats_count_revocations_and_rejected_requests():
+    cache = TokenCache()
+    cache.revoke_user(7)
+    claims = make_claims(user_id=7)
+    cache.is_revoked('a', claims)
+    cache.is_revoked('b', claims)
+
+    stats = cache.stats()
+    assert stats['revocations'] == 1
+    assert stats['rejected'] == 2
@@ -0,0 +1,149 @@
+# token_cache.py
+# Bounded cache of verified JWTs for the jwt_required decorator.
+# A token that has been decoded and verified once is served from here until it expires,
+# so repeated calls (product detail, recommendations) skip the HS256 verification.
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """
+    LRU cache mapping a SHA-256 digest of a token to its decoded claims.
+
+    Entries are dropped once the token's 'exp' has passed, so expiry is still enforced by jwt.decode.
+    Revocation is checked on every call, hit or miss:
+      * revoke_token() denylists a single token (logout),
+      * revoke_user() rejects every token of a user issued up to now (e.g. admin demotion),
+      * set_revocation_check() plugs in an extra check, e.g. a denylist shared by all gunicorn workers.
+    The built-in denylist lives in this process only; each worker keeps its own. The extra check is run
+    for every token that isn't cached, and again for a cached token once check_ttl seconds have passed.
+    """
+
+    def __init__(self, max_size=10000, max_token_age=86400, check_ttl=5.0):
+        self.max_size = max_size
+        self.max_token_age = max_token_age # Longest token lifetime; older user revocations are forgotten
+        self.check_ttl = check_ttl
+        self._entries = OrderedDict() # digest -> claims
+        self._checked_at = {} # digest -> when the revocation check last passed it (cached tokens only)
+        self._revoked_tokens = {} # digest -> exp, kept until the token would have expired anyway
+        self._revoked_users = {} # user_id -> tokens issued at or before this timestamp are rejected
+        self._revocation_check = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revocations = 0 # revoke_token() and revoke_user() calls
+        self.rejected = 0 # Requests refused because their token was revoked
+
+    @staticmethod
+    def digest(token):
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, digest):
+        """Returns the cached claims for a token digest, or None on a miss or if the token has expired."""
+        with self._lock:
+            claims = self._entries.get(digest)
+            if claims is not None and claims.get('exp', 0) <= time.time():
+                del self._entries[digest]
+                claims = None
+            if claims is None:
+                self._checked_at.pop(digest, None) # A token that isn't cached always gets a fresh check
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return claims
+
+    def put(self, digest, claims):
+        """Caches verified claims, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[digest] = claims
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._checked_at.pop(evicted, None)
+                self.evictions += 1
+
+    def is_revoked(self, digest, claims):
+        """True if the token was logged out, its user's tokens were revoked, or the revocation hook rejects it."""
+        now = time.time()
+        with self._lock:
+            revoked = digest in self._revoked_tokens
+            revoked_before = self._revoked_users.get(claims.get('user_id'))
+            # 'iat' has whole-second precision, so a token issued in the same second as the revocation
+            # is rejected whether it came just before or just after it
+            if revoked_before is not None and claims.get('iat', 0) <= revoked_before:
+                revoked = True
+            check = self._revocation_check
+            checked_at = self._checked_at.get(digest)
+        if not revoked and check is not None and (checked_at is None or now - checked_at >= self.check_ttl):
+            revoked = bool(check(digest, claims))
+            if not revoked:
+                with self._lock:
+                    self._checked_at[digest] = now
+        if revoked:
+            with self._lock:
+                self._entries.pop(digest, None)
+                self._checked_at.pop(digest, None)
+                self.rejected += 1
+        return revoked
+
+    def revoke_token(self, token, exp):
+        """Denylists a single token (e.g. on logout) until its expiry time."""
+        digest = self.digest(token)
+        now = time.time()
+        with self._lock:
+            # Forget denylisted tokens that have expired on their own
+            for d, d_exp in list(self._revoked_tokens.items()):
+                if d_exp <= now:
+                    del self._revoked_tokens[d]
+            self._revoked_tokens[digest] = exp
+            self._entries.pop(digest, None)
+            self._checked_at.pop(digest, None)
+            self.revocations += 1
+
+    def revoke_user(self, user_id):
+        """
+        Rejects every token of this user issued up to now (e.g. after the user is demoted from admin).
+        Returns the revocation time, so a shared store can record the same cutoff.
+        """
+        now = time.time()
+        with self._lock:
+            # Forget user revocations older than any token that could still be valid
+            for u, revoked_at in list(self._revoked_users.items()):
+                if revoked_at <= now - self.max_token_age:
+                    del self._revoked_users[u]
+            self._revoked_users[user_id] = now
+            for digest in [d for d, claims in self._entries.items() if claims.get('user_id') == user_id]:
+                del self._entries[digest]
+                self._checked_at.pop(digest, None)
+            self.revocations += 1
+        return now
+
+    def set_revocation_check(self, check):
+        """Registers check(digest, claims) -> bool, consulted on every request in addition to the built-in denylist."""
+        with self._lock:
+            self._revocation_check = check
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._checked_at.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'revocations': self.revocations,
+                'rejected': self.rejected,
+                'denylisted_tokens': len(self._revoked_tokens),
+                'revoked_users': len(self._revoked_users),
+            }